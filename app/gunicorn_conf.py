@@ -0,0 +1,44 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+
+# Server Socket
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Worker Processes
+# Each gevent worker serves up to worker_connections requests concurrently, so
+# keep SQLALCHEMY_ENGINE_OPTIONS pool_size + max_overflow per worker within
+# MySQL max_connections / workers. The 2*CPU+1 default is for bare-metal runs;
+# the Docker image sets GUNICORN_WORKERS because cpu_count() sees host cores.
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+# Keep client connections open between requests behind the load balancer
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Server Hooks
+def on_starting(server):
+    # Start every run with an empty Prometheus multiprocess directory
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+
+    # Wait for MySQL and create tables once, in a separate process so the
+    # arbiter never imports the app; a non-zero exit aborts startup. It runs
+    # without the multiprocess directory so it leaves no metric files behind.
+    env = {k: v for k, v in os.environ.items() if k != "PROMETHEUS_MULTIPROC_DIR"}
+    subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "app", "init-db"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        check=True,
+    )
+
+def child_exit(server, worker):
+    GunicornInternalPrometheusMetrics.mark_process_dead_on_child_exit(worker.pid)
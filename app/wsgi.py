@@ -0,0 +1,9 @@
+# Patch blocking I/O before anything imports socket, ssl or the MySQL driver
+from gevent import monkey
+
+monkey.patch_all()
+
+# Database wait and table creation already ran once in gunicorn's on_starting
+from app import app, warmup_pool  # noqa: E402
+
+warmup_pool()
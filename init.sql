@@ -6,6 +6,8 @@ CREATE TABLE IF NOT EXISTS absensi (
     id INT AUTO_INCREMENT PRIMARY KEY,
     nrp VARCHAR(20) NOT NULL,
     nama VARCHAR(100) NOT NULL,
-    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_absensi_timestamp_id (timestamp, id),
+    INDEX ix_absensi_nrp (nrp)
 );
 